@@ -1,8 +1,30 @@
 import os
+import functools
 from . import fs, utils
 
 
 
+def _find_jottbook_file(dirpath):
+    """Returns the path of the single .jott file within dirpath or None.
+    """
+    try:
+        files = [f for f in os.listdir(dirpath)
+                 if f.lower().endswith(Jottbook.EXT)]
+    except OSError:
+        return None
+
+    if len(files) == 1:
+        return fs.join(dirpath, files[0])
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _find_jottbook_marker(dirpath):
+    """Cached `_find_jottbook_file`; see `Jottbook.invalidate_discover_cache`.
+    """
+    return _find_jottbook_file(dirpath)
+
+
 class Jottbook:
     """Represents a Jott book which is a directory containing a collection
     of plain text files which together can be managed by Jott with files
@@ -66,14 +88,9 @@ class Jottbook:
         if fs.isfile(path) and file_ext_check_ok:
             return cls.from_file(path)
 
-        try:
-            files = [f for f in os.listdir(path)
-                     if f.lower().endswith(cls.EXT)]
-        except OSError:
-            return None
-
-        if len(files) == 1:
-            return cls.from_file(fs.join(path, files[0]))
+        jbook_file = _find_jottbook_file(path)
+        if jbook_file is not None:
+            return cls.from_file(jbook_file)
         return None
 
     @classmethod
@@ -82,16 +99,31 @@ class Jottbook:
         """
         if base is None:
             base = os.getcwd()
-        here = base
-        while True:
-            jbook = cls.from_path(here, extension_required=True)
+        here = fs.abspath(base)
+        if here.endswith(cls.EXT) and fs.isfile(here):
+            jbook = cls.from_file(here)
             if jbook is not None:
                 return jbook
+            here = fs.dirname(here)
+
+        while True:
+            marker = _find_jottbook_marker(here)
+            if marker is not None:
+                jbook = cls.from_file(marker)
+                if jbook is not None:
+                    return jbook
             node = fs.dirname(here)
             if node == here:
                 break
             here = node
 
+    @staticmethod
+    def invalidate_discover_cache():
+        """Forgets the .jott lookups cached by `discover`; call this after
+        creating or removing jottbooks within the same run.
+        """
+        _find_jottbook_marker.cache_clear()
+
     @property
     def jottbook_path(self):
         return self.tree or fs.dirname(self.jbook_file)
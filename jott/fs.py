@@ -5,6 +5,7 @@ interactions.
 """
 import os
 import enum
+import stat
 
 
 
@@ -38,10 +39,14 @@ def fsobject(path):
     """Returns a FSObject which could either be a Directory or File object
     depending on what the path is.
     """
-    if not exists(path):
+    stat_result = _try_stat(path)
+    if stat_result is None:
         message = 'Invalid or none existing filesystem path provided: %s'
         raise ValueError(message % path)
-    return Directory(path) if isdir(path) else File(path)
+
+    if stat.S_ISDIR(stat_result.st_mode):
+        return Directory(path, stat_result=stat_result)
+    return File(path, stat_result=stat_result)
 
 
 def isabs(path):
@@ -71,21 +76,32 @@ def join(path, *paths):
     return os.path.join(path, *paths)
 
 
+def _try_stat(path):
+    """Returns the result of os.stat for a path or None if it cannot be stat'd.
+    """
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
 class FSObject:
     """Provides the common interface for FileSystem objects.
     """
 
-    def __init__(self, fullpath):
-        if not (isabs(fullpath) or exists(fullpath)):
+    def __init__(self, fullpath, stat_result=None):
+        if not (isabs(fullpath) or stat_result is not None or exists(fullpath)):
             raise ValueError("Invalid path provided. Expected an absolute path "
                              "that exists. Provided path: %s" % fullpath)
         self.__fullpath = fullpath
+        self.__basename = os.path.basename(fullpath)
+        self._stat = stat_result
 
     @property
     def basename(self):
         """Returns the base name of the filesystem object.
         """
-        return os.path.basename(self.__fullpath)
+        return self.__basename
 
     @property
     def children(self):
@@ -107,6 +123,19 @@ class FSObject:
         """
         pass
 
+    def stat(self, force=False):
+        """Returns the os.stat result for the filesystem object. The result is
+        cached on first use; pass `force` to refresh it.
+        """
+        if force or self._stat is None:
+            self._stat = os.stat(self.__fullpath)
+        return self._stat
+
+    def invalidate_stat(self):
+        """Discards the cached stat result, e.g. after the object changed.
+        """
+        self._stat = None
+
     def __repr__(self):
         return "<%s %r>" % (
             self.__class__.__name__,
@@ -127,11 +156,14 @@ class Directory(FSObject):
     """Represents a directory filesystem object.
     """
 
-    def __init__(self, fullpath, listing_flag=DirListingFlag.ALL):
-        if exists(fullpath) and not isdir(fullpath):
-            fullpath = dirname(fullpath)
+    def __init__(self, fullpath, listing_flag=DirListingFlag.ALL,
+                 stat_result=None):
+        if stat_result is None:
+            stat_result = _try_stat(fullpath)
+        if stat_result is not None and not stat.S_ISDIR(stat_result.st_mode):
+            fullpath, stat_result = dirname(fullpath), None
 
-        super(Directory, self).__init__(fullpath)
+        super(Directory, self).__init__(fullpath, stat_result)
         self._listing_flag = listing_flag
 
     def _get_listing_flag(self):
@@ -144,31 +176,52 @@ class Directory(FSObject):
 
     @property
     def children(self):
-        root, dirs, files = next(os.walk(self.fullpath))
-
-        assets = []
-        if DirListingFlag.DIRECTORY in self._listing_flag:
-            assets.append((Directory, dirs))
-        if DirListingFlag.FILE in self._listing_flag:
-            assets.append((File, files))
-
-        for factory, items in assets:
-            for item in items:
-                yield factory(join(root, item))
+        # a single scandir pass; DirEntry.is_dir uses the type info returned
+        # with the listing, so only entries of the listed kinds get stat'ed
+        want_dirs = DirListingFlag.DIRECTORY in self._listing_flag
+        want_files = DirListingFlag.FILE in self._listing_flag
+        dirs, files = [], []
+        with os.scandir(self.fullpath) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if want_dirs:
+                        dirs.append(entry)
+                elif want_files:
+                    files.append(entry)
+
+        for factory, items in ((Directory, dirs), (File, files)):
+            for entry in items:
+                try:
+                    stat_result = entry.stat()
+                except OSError:
+                    stat_result = None
+                yield factory(entry.path, stat_result=stat_result)
 
 
 class File(FSObject):
     """Represents a file object.
     """
 
-    def __init__(self, fullpath):
-        if exists(fullpath) and not isfile(fullpath):
+    def __init__(self, fullpath, stat_result=None):
+        if stat_result is None:
+            stat_result = _try_stat(fullpath)
+        if stat_result is not None and not stat.S_ISREG(stat_result.st_mode):
             raise ValueError('Full path to a file expected')
-        super(File, self).__init__(fullpath)
+        super(File, self).__init__(fullpath, stat_result)
 
     @property
     def last_modified(self):
-        return os.path.getmtime(self.fullpath)
+        return self.stat().st_mtime
+
+    def remove(self):
+        """Deletes the file from disk; a file that is already gone is not
+        treated as an error.
+        """
+        try:
+            os.unlink(self.fullpath)
+        except FileNotFoundError:
+            pass
+        self.invalidate_stat()
 
     def __str__(self):
         if '.' in self.basename:
@@ -1,5 +1,7 @@
 import wx
+import functools
 from wx import Colour, Font
+from . import images
 
 
 ## COLORS
@@ -19,3 +21,28 @@ FONTI_LSZ = wx.FontInfo(13).Family(wx.FONTFAMILY_DEFAULT)
 FONTI_NSZ = wx.FontInfo(12).Family(wx.FONTFAMILY_DEFAULT)
 FONTI_MZM = wx.FontInfo(11).Family(wx.FONTFAMILY_DEFAULT)
 FONTI_SSZ = wx.FontInfo(10).Family(wx.FONTFAMILY_DEFAULT)
+
+
+@functools.lru_cache(maxsize=64)
+def get_font(fontinfo, bold=False, italic=False, smaller=False):
+    """Returns a font created from one of the FONTI_* font infos with the
+    requested style applied. Fonts are created once per distinct style and
+    shared, so callers must not modify the returned font in place.
+    """
+    font = wx.Font(fontinfo)
+    if smaller:
+        font = font.Smaller()
+    if bold:
+        font = font.Bold()
+    if italic:
+        font = font.Italic()
+    return font
+
+
+## BITMAPS
+@functools.lru_cache(maxsize=None)
+def get_bitmap(name):
+    """Returns the bitmap for the named embedded image. Each image is decoded
+    only once per process and shared by all widgets using it.
+    """
+    return getattr(images, name).GetBitmap()
@@ -1,15 +1,23 @@
 import os
 import wx
 import time
-from . import common, images
+from concurrent import futures
+from . import common
 from . import commands as cmds
 
 import logging
 log = logging.getLogger(__name__)
 
 
+# workers used to prepare item display data away from the UI thread
+_PRECOMPUTE_POOL = futures.ThreadPoolExecutor(max_workers=2)
+
+
 class SimpleVListBox(wx.VListBox):
     HIGHLITE_BGCOLOUR = common.HLCOLOUR_FSP_ITEMS
+    # True when item labels are costly enough that panels build them with
+    # BuildDisplayCache off the UI thread rather than lazily when drawn
+    PRECOMPUTES_DISPLAY = False
 
     def __init__(self, *args, **kw):
         kw.update({'style': wx.LB_SINGLE})
@@ -19,6 +27,10 @@ class SimpleVListBox(wx.VListBox):
         self._padding_right = 0
         self._padding_vert = 10
         self._inner_list = []
+        self._display_cache = []
+        self._row_height = None
+        self._paint_state = None
+        self.Bind(wx.EVT_PAINT, self._OnPaint)
 
     @property
     def CurrentItem(self):
@@ -50,47 +62,139 @@ class SimpleVListBox(wx.VListBox):
     @PaddingVertical.setter
     def PaddingVertical(self, value):
         self._padding_vert = value
+        self._ResetRowHeight()
 
     def AppendItem(self, item):
         if not item:
             return
         self._inner_list.append(item)
         count = len(self._inner_list)
-        if self.IsRowVisible(count):
-            self.Refresh()
+        self._InsertItemCaches(count - 1)
+        self.SetItemCount(count)
+        self.RefreshRow(count - 1)
 
     def ClearItems(self):
-        self._inner_list.clear()
+        self._inner_list = []
+        self._ResetItemCaches()
+        self.SetItemCount(0)
         self.Refresh()
 
     def InsertItem(self, index, item):
         if index < 0 or index > len(self._inner_list):
             raise ValueError('Invalid index position for insert.')
         self._inner_list.insert(index, item)
-        if self.IsRowVisible(index):
-            self.Refresh()
+        self._InsertItemCaches(index)
+        count = len(self._inner_list)
+        self.SetItemCount(count)
+        self.RefreshRows(index, count - 1)
 
-    def SetItems(self, items):
+    @classmethod
+    def BuildDisplayCache(cls, items):
+        """Returns the labels for all items, as later passed to SetItems.
+        Makes no wx calls and so is safe to run on a worker thread.
+        """
+        return [cls._GetItemLabels(item) for item in items]
+
+    def SetItems(self, items, display_cache=None):
         items = items or []
-        if self._inner_list != items:
-            self._inner_list = items
-            self.Refresh()
+        previous = self._inner_list
+        if items is previous:
+            return
+
+        # a single scan both detects equal lists and finds the first row
+        # needing a repaint
+        first_index = self._FirstChangedIndex(previous, items)
+        if first_index == len(previous) == len(items):
+            return
+
+        self._inner_list = items
+        if display_cache is not None:
+            self._display_cache = display_cache
+        else:
+            self._ResetItemCaches()
+        if len(items) != len(previous):
+            self.SetItemCount(len(items))
+        if items and self.GetSelection() == wx.NOT_FOUND:
+            self.SetSelection(0)
+
+        last_index = max(len(previous), len(items)) - 1
+        self.RefreshRows(first_index, last_index)
+
+    def SetFont(self, font):
+        self._ResetRowHeight()
+        return super(SimpleVListBox, self).SetFont(font)
 
     def SetItemHightliteBGColour(self, value):
         self._highlite_bgcolour = value
 
+    def _FirstChangedIndex(self, previous, items):
+        for index, (old_item, new_item) in enumerate(zip(previous, items)):
+            if old_item != new_item:
+                return index
+        return min(len(previous), len(items))
+
     def _IsValidItemIndex(self, index):
         return (index >= 0 and index < len(self._inner_list))
 
+    def _ResetItemCaches(self):
+        """Discards all cached per-item data. Called whenever the items of
+        the listbox are replaced; labels do not depend on font or padding.
+        """
+        self._display_cache = [None] * len(self._inner_list)
+
+    def _ResetRowHeight(self):
+        """Discards the cached row height. Called whenever the font or padding
+        of the listbox change.
+        """
+        self._row_height = None
+
+    def _InsertItemCaches(self, index):
+        """Makes room within the per-item caches for an item inserted at the
+        provided index.
+        """
+        self._display_cache.insert(index, None)
+
+    @staticmethod
+    def _GetItemLabels(item):
+        return str(item)
+
+    def _GetDisplayInfo(self, item_idx):
+        """Returns the label(s) drawn for an item, computing them only on
+        first use.
+        """
+        info = self._display_cache[item_idx]
+        if info is None:
+            info = self._GetItemLabels(self._inner_list[item_idx])
+            self._display_cache[item_idx] = info
+        return info
+
+    def _ComputeRowHeight(self):
+        return self.GetCharHeight() + self._padding_vert
+
+    def _OnPaint(self, evt):
+        # snapshot the (selection, font, foreground) shared by every row
+        # drawn during this paint pass instead of querying them per row
+        self._paint_state = (
+            self.GetSelection(), self.GetFont(), self.GetForegroundColour()
+        )
+        evt.Skip()
+
+    def _GetPaintState(self):
+        if self._paint_state is None:
+            return (self.GetSelection(), self.GetFont(),
+                    self.GetForegroundColour())
+        return self._paint_state
+
     def OnDrawItem(self, dc, rect, item_idx):
         if not self._IsValidItemIndex(item_idx):
             return
 
+        selection, font, foreground = self._GetPaintState()
         colour = self._highlite_bgcolour
-        if self.GetSelection() != item_idx:
-            colour = self.GetForegroundColour()
+        if selection != item_idx:
+            colour = foreground
 
-        dc.SetFont(self.GetFont())
+        dc.SetFont(font)
         dc.SetTextForeground(colour)
 
         if self._padding_left > 0:
@@ -103,37 +207,79 @@ class SimpleVListBox(wx.VListBox):
             rect.width -= value
 
         flags = wx.ALIGN_LEFT | wx.ALIGN_CENTER_VERTICAL
-        text = str(self._inner_list[item_idx])
+        text = self._GetDisplayInfo(item_idx)
         dc.DrawLabel(text, rect, flags)
 
     def OnMeasureItem(self, item_idx):
         if not self._IsValidItemIndex(item_idx):
             return 0
 
-        text = str(self._inner_list[item_idx])
-        width, height = self.GetTextExtent(text)
-        return height + self._padding_vert
+        # rows are a line of text tall regardless of their content, so the
+        # height is computed once rather than measuring each item's text
+        if self._row_height is None:
+            self._row_height = self._ComputeRowHeight()
+        return self._row_height
 
 
 class FileVListBox(SimpleVListBox):
     HIGHLITE_BGCOLOUR = common.HLCOLOUR_FSP_ITEMS
+    PRECOMPUTES_DISPLAY = True
 
     def __init__(self, *args, **kw):
         super(FileVListBox, self).__init__(*args, **kw)
         self._padding_right = 10
         self._padding_left = 10
         self._padding_vert = 20
+        self._draw_styles = None
+
+    def SetFont(self, font):
+        self._draw_styles = None
+        return super(FileVListBox, self).SetFont(font)
+
+    def SetForegroundColour(self, colour):
+        self._draw_styles = None
+        return super(FileVListBox, self).SetForegroundColour(colour)
+
+    def SetItemHightliteBGColour(self, value):
+        self._draw_styles = None
+        super(FileVListBox, self).SetItemHightliteBGColour(value)
+
+    @staticmethod
+    def _GetItemLabels(file_item):
+        timestamp = time.asctime(time.gmtime(file_item.last_modified))
+        return (str(file_item).upper(), timestamp)
+
+    def _GetDrawStyles(self, dc):
+        """Returns the (bold font, bold line height, timestamp font, timestamp
+        colours) used to draw items; derived once and reused until the font
+        or colours change.
+        """
+        if self._draw_styles is None:
+            font = self.GetFont()
+            font_bold = font.Bold()
+            height_bold = dc.GetFullTextExtent('Mg', font_bold)[1]
+            highlite = self._highlite_bgcolour
+            foreground = self.GetForegroundColour()
+            font_timestamp = font.Smaller().Italic()
+            self._draw_styles = (font_bold, height_bold, font_timestamp, {
+                True: highlite.ChangeLightness(160),
+                False: foreground.ChangeLightness(160)
+            })
+        return self._draw_styles
 
     def OnDrawItem(self, dc, rect, item_idx):
         if not self._IsValidItemIndex(item_idx):
             return
 
+        selection, _, foreground = self._GetPaintState()
+        selected = selection == item_idx
         colour = self._highlite_bgcolour
-        if self.GetSelection() != item_idx:
-            colour = self.GetForegroundColour()
+        if not selected:
+            colour = foreground
 
-        font = self.GetFont()
-        dc.SetFont(font.Bold())
+        styles = self._GetDrawStyles(dc)
+        font_bold, height_bold, font_timestamp, colours_timestamp = styles
+        dc.SetFont(font_bold)
         dc.SetTextForeground(colour)
 
         if self._padding_left > 0:
@@ -145,30 +291,21 @@ class FileVListBox(SimpleVListBox):
             value = self._padding_right
             rect.width -= value
 
-        flags = wx.ALIGN_LEFT
-        rect_height = rect.height
-        file_item = self._inner_list[item_idx]
-
-        # file name text
-        text = str(file_item).upper()
-        rect.height = rect_height / 2
-        dc.DrawLabel(text, rect, flags | wx.ALIGN_BOTTOM)
+        # labels are single line and left aligned so they are drawn at known
+        # offsets, sparing DrawLabel's per call layout work
+        half_height = rect.height // 2
+        text, timestamp = self._GetDisplayInfo(item_idx)
 
-        # last modified test
-        dc.SetFont(font.Smaller().Italic())
-        dc.SetTextForeground(colour.ChangeLightness(160))
+        # file name text; bottom aligned within the upper half
+        dc.DrawText(text, rect.x, rect.y + half_height - height_bold)
 
-        rect.Y += rect.height
-        timestamp = time.asctime(time.gmtime(file_item.last_modified))
-        dc.DrawLabel(timestamp, rect, flags | wx.ALIGN_TOP)
+        # last modified text; top aligned within the lower half
+        dc.SetFont(font_timestamp)
+        dc.SetTextForeground(colours_timestamp[selected])
+        dc.DrawText(timestamp, rect.x, rect.y + half_height)
 
-    def OnMeasureItem(self, item_idx):
-        if not self._IsValidItemIndex(item_idx):
-            return 0
-
-        text = str(self._inner_list[item_idx])
-        width, height = self.GetTextExtent(text)
-        return (height * 2) + self._padding_vert
+    def _ComputeRowHeight(self):
+        return (self.GetCharHeight() * 2) + self._padding_vert
 
 
 class FSObjectPanel(wx.Panel):
@@ -178,10 +315,14 @@ class FSObjectPanel(wx.Panel):
     MIN_WIDTH = 180
     BGCOLOUR = common.BGCOLOUR_LITE
     FGCOLOUR_ITEMS = common.FGCOLOUR_FSP_ITEMS
+    # required: the SimpleVListBox subclass used to list the panel's items
+    LISTBOX_CLASS = None
+    LISTBOX_MARGIN_TOP = 0
 
     def __init__(self, *args, **kw):
         # listbox widget used to display item listings
         self._vlistbox = None
+        self._pending_items = None
 
         # initialize
         super(FSObjectPanel, self).__init__(*args, **kw)
@@ -189,22 +330,45 @@ class FSObjectPanel(wx.Panel):
         self._bind_handlers()
 
     def _layout_widgets(self):
+        self.Freeze()
         self.SetBackgroundColour(self.BGCOLOUR)
-        self._root_sizer = wx.BoxSizer(wx.VERTICAL)
-        self.SetSizer(self._root_sizer)
+        self._root_sizer = root_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.SetSizer(root_sizer)
+        self._font = common.get_font(common.FONTI_LSZ)
+        self.SetFont(self._font)
+        self._layout_header(root_sizer)
+
+        # listbox
+        listbox = self._get_listbox_widget()
+        root_sizer.Add(listbox, 1, wx.EXPAND | wx.TOP, self.LISTBOX_MARGIN_TOP)
+        self.Thaw()
+
+    def _layout_header(self, root_sizer):
+        """Adds the widgets to be displayed above the listbox. Nothing is
+        added by default.
+        """
+        pass
 
     def _get_listbox_widget(self):
         """Returns the ListBox widget to be used for listing items within
         the panel.
         """
-        raise NotImplementedError()
+        if self._vlistbox is None:
+            if self.LISTBOX_CLASS is None:
+                raise NotImplementedError(
+                    '%s must set LISTBOX_CLASS' % self.__class__.__name__)
+            listbox = self.LISTBOX_CLASS(self, style=wx.BORDER_NONE)
+            listbox.SetForegroundColour(self.FGCOLOUR_ITEMS)
+            listbox.SetBackgroundColour(self.BGCOLOUR)
+            self._vlistbox = listbox
+        return self._vlistbox
 
     def _bind_handlers(self):
         self.Bind(wx.EVT_LISTBOX, self._on_selection_changed)
 
     def _on_selection_changed(self, evt):
         item = self.CurrentItem
-        log.debug('Selection changed. Current Item: %s' % item)
+        log.debug('Selection changed. Current Item: %s', item)
         event_args = (cmds.FSObjectPanelEventType, self.GetId(), self, item)
         event = cmds.FSObjectPanelEvent(*event_args)
         self.GetEventHandler().ProcessEvent(event)
@@ -216,12 +380,42 @@ class FSObjectPanel(wx.Panel):
         return listbox.CurrentItem
 
     def SetItems(self, items):
-        log.debug('%s.SetItems: %s' % (self.__class__.__name__, items))
+        """Shows the provided items in the listbox. For listboxes that
+        precompute display data the items are installed asynchronously via
+        wx.CallAfter, so CurrentItem and the listed items still reflect the
+        previous items until then; only the latest call takes effect.
+        """
+        log.debug('%s.SetItems: %s', self.__class__.__name__, items)
         listbox = self._get_listbox_widget()
+        self._pending_items = None
         if not items:
             listbox.ClearItems()
             return
-        listbox.SetItems(items)
+
+        if not listbox.PRECOMPUTES_DISPLAY:
+            listbox.SetItems(items)
+            return
+
+        # build display data on a worker; only the latest request is applied
+        self._pending_items = token = object()
+        future = _PRECOMPUTE_POOL.submit(listbox.BuildDisplayCache, items)
+        future.add_done_callback(lambda f: wx.CallAfter(
+            self._install_items, token, items, f
+        ))
+
+    def _install_items(self, token, items, future):
+        if not self or token is not self._pending_items:
+            return
+
+        self._pending_items = None
+        listbox = self._get_listbox_widget()
+        if future.exception() is not None:
+            # fall back to computing display data lazily when drawn
+            log.warning('Display data precompute failed',
+                        exc_info=future.exception())
+            listbox.SetItems(items)
+            return
+        listbox.SetItems(items, future.result())
 
 
 class DirectoryPanel(FSObjectPanel):
@@ -229,6 +423,8 @@ class DirectoryPanel(FSObjectPanel):
     """
     BGCOLOUR = common.BGCOLOUR_DARK
     FGCOLOUR_TITLE = common.FGCOLOUR_FSP_TITLE
+    LISTBOX_CLASS = SimpleVListBox
+    LISTBOX_MARGIN_TOP = 5
 
     def __init__(self, parent, title='System Jotts', **kw):
         super().__init__(parent, **kw)
@@ -243,25 +439,10 @@ class DirectoryPanel(FSObjectPanel):
 
     Title = property(_get_title, _set_title)
 
-    def _get_listbox_widget(self):
-        if self._vlistbox is None:
-            listbox = SimpleVListBox(self, style=wx.BORDER_NONE)
-            listbox.SetForegroundColour(self.FGCOLOUR_ITEMS)
-            listbox.SetBackgroundColour(self.BGCOLOUR)
-            listbox.SetItemCount(100)
-            listbox.SetSelection(0)
-            self._vlistbox = listbox
-        return self._vlistbox
-
-    def _layout_widgets(self):
-        self.Freeze()
-        super(DirectoryPanel, self)._layout_widgets()
-        root_sizer = self._root_sizer
-        self._font = wx.Font(common.FONTI_LSZ)
-        self._font_label = self._font.Smaller().Bold()
-
-        self.SetBackgroundColour(self.BGCOLOUR)
-        self.SetFont(self._font)
+    def _layout_header(self, root_sizer):
+        self._font_label = common.get_font(
+            common.FONTI_LSZ, bold=True, smaller=True
+        )
 
         # label
         self._lbl_title = label = wx.StaticText(self, label='::[StaticText]')
@@ -269,38 +450,12 @@ class DirectoryPanel(FSObjectPanel):
         label.SetFont(self._font_label)
         root_sizer.Add(label, 0, wx.TOP | wx.LEFT, 10)
 
-        # listbox
-        listbox = self._get_listbox_widget()
-        root_sizer.Add(listbox, 1, wx.EXPAND | wx.TOP, 5)
-        self.Thaw()
-
 
 class FilePanel(FSObjectPanel):
     """Represents a panel for listing files in a particular directory.
     """
     MIN_WIDTH = 250
-
-    def _get_listbox_widget(self):
-        if self._vlistbox is None:
-            listbox = FileVListBox(self, style=wx.BORDER_NONE)
-            listbox.SetForegroundColour(self.FGCOLOUR_ITEMS)
-            listbox.SetBackgroundColour(self.BGCOLOUR)
-            listbox.SetItemCount(100)
-            listbox.SetSelection(0)
-            self._vlistbox = listbox
-        return self._vlistbox
-
-    def _layout_widgets(self):
-        self.Freeze()
-        super(FilePanel, self)._layout_widgets()
-        root_sizer = self._root_sizer
-        self._font = wx.Font(common.FONTI_LSZ)
-        self.SetFont(self._font)
-
-        # listbox
-        listbox = self._get_listbox_widget()
-        root_sizer.Add(listbox, 1, wx.EXPAND | wx.TOP, 0)
-        self.Thaw()
+    LISTBOX_CLASS = FileVListBox
 
 
 class ContentBase:
@@ -347,7 +502,7 @@ class DirectoryContent(ContentBase):
         # create content control buttons
         btn_style = wx.BU_LEFT | wx.BORDER_NONE
         self._btn_new = btn_new =    wx.Button(rcontent, label='  New Folder', style=btn_style)
-        btn_new.SetBitmap(images.folder_plus.GetBitmap())
+        btn_new.SetBitmap(common.get_bitmap('folder_plus'))
         rsizer.Add(btn_new, 0, wx.ALL, 10)
 
         ## sizers
@@ -359,24 +514,35 @@ class DirectoryContent(ContentBase):
         return self._root_content
 
     def add_directory_panel(self, title, items):
-        self._base_content.Freeze()
-        panel = DirectoryPanel(self._base_content, title)
-        panel.SetItems(items)
+        return self.add_directory_panels([(title, items)])[0]
 
-        self._base_sizer.Add(panel, 1, wx.EXPAND | wx.BOTTOM, 5)
-        self._base_content.Thaw()
+    def add_directory_panels(self, panel_specs):
+        """Adds a directory panel for each (title, items) pair provided. The
+        content is frozen and laid out once for the whole batch.
+        """
+        bcontent = self._base_content
+        bcontent.Freeze()
+        panels = []
+        for title, items in panel_specs:
+            panel = DirectoryPanel(bcontent, title)
+            panel.SetItems(items)
+            self._base_sizer.Add(panel, 1, wx.EXPAND | wx.BOTTOM, 5)
+            panels.append(panel)
 
-        self._panels.append(panel)
-        return panel
+        bcontent.Layout()
+        bcontent.Thaw()
 
-    def clear_panels(self):
-        self.Freeze()
-        for panel in self._panels:
-            self._base_content.RemoveChild(panel)
-            panel.Destroy()
+        self._panels.extend(panels)
+        return panels
 
+    def clear_panels(self):
+        bcontent = self._base_content
+        bcontent.Freeze()
+        self._base_sizer.Clear(delete_windows=False)
+        bcontent.DestroyChildren()
         self._panels.clear()
-        self.Thaw()
+        bcontent.Layout()
+        bcontent.Thaw()
 
     def _on_panel_child_focus(self, event):
-        log.debug('Panel Child Control Received Focus: %s' % event)
+        log.debug('Panel Child Control Received Focus: %s', event)
@@ -1,8 +1,39 @@
 import os
+import re
 import sys
+import base64
+import fnmatch
 import argparse
-from shutil import fnmatch
-from wx.tools import img2py
+import functools
+import posixpath
+import collections
+from concurrent import futures
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_glob(pattern):
+    return re.compile(fnmatch.translate(os.path.normcase(pattern)))
+
+
+def _filter_posix(names, pattern):
+    match = _compile_glob(pattern).match
+    return [n for n in names if match(n)]
+
+
+def _filter_nt(names, pattern):
+    match = _compile_glob(pattern).match
+    normcase = os.path.normcase
+    return [n for n in names if match(normcase(n))]
+
+
+# os.path.normcase is a no-op on posix, so it is only applied per name on
+# platforms where it folds case or separators
+_filter_names = _filter_posix if os.path is posixpath else _filter_nt
+
+
+def _read_file(filepath):
+    with open(filepath, 'rb') as f:
+        return f.read()
 
 
 class Command:
@@ -26,63 +57,111 @@ class Command:
 class PyEmbedImageCommand(Command):
     name = 'img-embed'
     ext_pattern = '*.png'
+    line_width = 72
+    buffer_size = 1 << 20
+    read_workers = 4
+    read_depth = 8
+    separator = '#' + '-' * 70 + '\n'
 
     parser = argparse.ArgumentParser(description='Python Embeddable Image')
     add = parser.add_argument
     add('source', help='Directory containing files or file to embed')
-    add('-o', '--out', dest='outfile', type=argparse.FileType('a'))
+    add('-o', '--out', dest='outfile', required=True)
 
     def _norm_filename(self, filename):
         if filename:
             filename = os.path.splitext(filename)[0].replace('--', '-')
         return filename
 
+    def _read_files(self, filepaths):
+        """Yields the content of each file in order, reading ahead on worker
+        threads with at most `read_depth` reads in flight.
+        """
+        with futures.ThreadPoolExecutor(self.read_workers) as pool:
+            pending = collections.deque()
+            for filepath in filepaths:
+                pending.append(pool.submit(_read_file, filepath))
+                if len(pending) >= self.read_depth:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _emit_header(self, out):
+        out.write(self.separator)
+        generator = '%s %s' % (os.path.basename(sys.argv[0]), self.name)
+        out.write('# This file was generated by %s\n#\n' % generator)
+        out.write('from wx.lib.embeddedimage import PyEmbeddedImage\n\n')
+
+    def _emit_image(self, out, name, data):
+        """Writes a PyEmbeddedImage assignment for the provided PNG data in
+        the same layout as `wx.tools.img2py`.
+        """
+        encoded = base64.b64encode(data).decode('ascii')
+        width = self.line_width
+        lines = ["    b'%s'" % encoded[i:i + width]
+                    for i in range(0, len(encoded), width)]
+        out.write(self.separator)
+        out.write('%s = PyEmbeddedImage(\n%s)\n\n' % (name, '\n'.join(lines)))
+
     def execute(self, args):
         arg = self.parser.parse_args(args)
-        if not os.path.exists(arg.source):
+        source_path = os.path.abspath(arg.source)
+        try:
+            with os.scandir(source_path) as entries:
+                dir_files = [e.name for e in entries if e.is_file()]
+            target_files = _filter_names(dir_files, self.ext_pattern)
+        except FileNotFoundError:
             self._error('source not found: %s' % arg.source)
-
-        if os.path.isfile(arg.source):
-            reldir, fn = os.path.split(arg.source)
-            source_path = os.path.abspath(reldir)
+        except NotADirectoryError:
+            source_path, fn = os.path.split(source_path)
+            if not _filter_names((fn,), self.ext_pattern):
+                self._error('source is not a png image: %s' % arg.source)
             target_files = (fn,)
-        else:
-            source_path = os.path.abspath(arg.source)
-            dir_files = os.listdir(source_path)
-            target_files = fnmatch.filter(dir_files, self.ext_pattern)
 
         if not target_files:
             print('No image file(s) found at provided source')
             sys.exit(0)
 
-        full_filepath = os.path.abspath(arg.outfile.name)
+        full_filepath = os.path.abspath(arg.outfile)
         outdir = os.path.dirname(full_filepath)
-        if not os.path.exists(outdir):
-            try:
-                os.makedirs(outdir)
-            except Exception as ex:
-                msg = "couldn't create base directory for outfile: %s. error: %s"
-                self._error(msg % (arg.outfile, str(ex)))
-
-        for fn in sorted(target_files):
-            img2py.img2py(os.path.join(source_path, fn), full_filepath,
-                          append=True, imgName=self._norm_filename(fn))
+        try:
+            os.makedirs(outdir, exist_ok=True)
+        except OSError as ex:
+            msg = "couldn't create base directory for outfile: %s. error: %s"
+            self._error(msg % (arg.outfile, str(ex)))
+
+        # all images are written through one large buffer rather than
+        # reopening the outfile for each image
+        try:
+            out = open(full_filepath, 'a', buffering=self.buffer_size)
+        except OSError as ex:
+            msg = "couldn't open outfile: %s. error: %s"
+            self._error(msg % (arg.outfile, str(ex)))
+
+        with out:
+            if out.tell() == 0:
+                self._emit_header(out)
+            target_files = sorted(target_files)
+            filepaths = [os.path.join(source_path, fn) for fn in target_files]
+            for fn, data in zip(target_files, self._read_files(filepaths)):
+                self._emit_image(out, self._norm_filename(fn), data)
 
         print('%i file(s) processed' % len(target_files))
 
 
 class Runner:
     prog = 'cli'
-    _command_registry = {
-        PyEmbedImageCommand
+    _command_registry = (
+        PyEmbedImageCommand,
+    )
+    _command_dict = {
+        c.name: c
+            for c in _command_registry
     }
 
     @property
     def command_dict(self):
-        return {
-            c.name: c
-                for c in self._command_registry
-        }
+        return self._command_dict
 
     def _usage(self):
         available_cmds = list(self.command_dict.keys())
@@ -98,17 +177,18 @@ class Runner:
         sys.exit(code)
 
     def run(self, argv):
-        if argv and argv[0].lower() == '-h':
-            self._usage()
-
-        command_dict = self.command_dict
-        available_cmds = command_dict.keys()
-        if not argv or argv[0] not in available_cmds:
-            expected = ', '.join(available_cmds)
-            xarg = argv[0] if argv else '?'
-            self._error('unknown command: %s. Expected: %s' % (xarg, expected))
-
-        command = command_dict[argv[0]](self)
+        name = argv[0] if argv else None
+        command_cls = self._command_dict.get(name)
+        if command_cls is None:
+            # help and error messages are only prepared when not dispatching
+            if name and name.lower() in ('-h', '--help'):
+                return self._usage()
+
+            expected = ', '.join(self._command_dict)
+            message = 'unknown command: %s. Expected: %s'
+            return self._error(message % (name or '?', expected))
+
+        command = command_cls(self)
         command.execute(argv[1:])
 
 
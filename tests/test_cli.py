@@ -0,0 +1,74 @@
+import base64
+
+import pytest
+from jott.utils.cli import Runner, PyEmbedImageCommand
+
+
+# 120 bytes encode to 160 base64 chars, i.e. lines of 72, 72 and 16 chars
+PNG_DATA = bytes(range(120))
+
+
+def run_img_embed(*args):
+    with pytest.raises(SystemExit):
+        Runner().run(['img-embed'] + list(args))
+
+
+class TestPyEmbedImageCommand(object):
+
+    @pytest.fixture
+    def srcdir(self, tmpdir):
+        srcdir = tmpdir.mkdir('images')
+        srcdir.join('folder_plus.png').write_binary(PNG_DATA)
+        return srcdir
+
+    def test_emits_image_stanza_in_img2py_layout(self, srcdir, tmpdir):
+        outfile = tmpdir.join('images.py')
+        Runner().run(['img-embed', str(srcdir), '-o', str(outfile)])
+
+        encoded = base64.b64encode(PNG_DATA).decode('ascii')
+        expected = (PyEmbedImageCommand.separator +
+                    'folder_plus = PyEmbeddedImage(\n'
+                    "    b'%s'\n    b'%s'\n    b'%s')\n\n"
+                    % (encoded[:72], encoded[72:144], encoded[144:]))
+        content = outfile.read()
+        assert content.startswith(PyEmbedImageCommand.separator)
+        assert 'from wx.lib.embeddedimage import PyEmbeddedImage\n' in content
+        assert content.endswith(expected)
+
+    def test_header_is_written_once_across_appends(self, srcdir, tmpdir):
+        outfile = tmpdir.join('images.py')
+        Runner().run(['img-embed', str(srcdir), '-o', str(outfile)])
+        Runner().run(['img-embed', str(srcdir), '-o', str(outfile)])
+
+        content = outfile.read()
+        assert content.count('from wx.lib.embeddedimage import') == 1
+        assert content.count('folder_plus = PyEmbeddedImage(') == 2
+
+    def test_accepts_single_file_source(self, srcdir, tmpdir, capsys):
+        outfile = tmpdir.join('images.py')
+        srcdir.join('trash.png').write_binary(PNG_DATA)
+        source = srcdir.join('trash.png')
+        Runner().run(['img-embed', str(source), '-o', str(outfile)])
+
+        content = outfile.read()
+        assert 'trash = PyEmbeddedImage(' in content
+        assert 'folder_plus' not in content
+        assert '1 file(s) processed' in capsys.readouterr().out
+
+    def test_rejects_non_png_single_file_source(self, tmpdir, capsys):
+        source = tmpdir.join('notes.txt')
+        source.write('')
+        run_img_embed(str(source), '-o', str(tmpdir.join('images.py')))
+        assert 'source is not a png image' in capsys.readouterr().out
+
+    def test_reports_missing_source(self, tmpdir, capsys):
+        source = tmpdir.join('missing')
+        run_img_embed(str(source), '-o', str(tmpdir.join('images.py')))
+        assert 'source not found' in capsys.readouterr().out
+
+    def test_reports_no_images_found(self, tmpdir, capsys):
+        srcdir = tmpdir.mkdir('empty')
+        outfile = tmpdir.join('images.py')
+        run_img_embed(str(srcdir), '-o', str(outfile))
+        assert 'No image file(s) found' in capsys.readouterr().out
+        assert not outfile.exists()
@@ -36,3 +36,22 @@ class TestJottbook(object):
     def test_auto_discover_returns_None_if_no_project_found(self):
         jbook = Jottbook.discover(fs.dirname(__file__))
         assert jbook is None
+
+    def test_auto_discover_finds_jottbook_after_invalidation(self, tmpdir):
+        path = tmpdir.mkdir('notes').mkdir('daily')
+        assert Jottbook.discover(str(path)) is None
+
+        tmpdir.join('notes', '.jott').write('[jott]\nname = Notes\n')
+        Jottbook.invalidate_discover_cache()
+        jbook = Jottbook.discover(str(path))
+        assert jbook is not None
+        assert jbook.name == 'Notes'
+
+    def test_auto_discover_skips_empty_jottfile_base(self, tmpdir):
+        tmpdir.join('.jott').write('[jott]\nname = Notes\n')
+        path = tmpdir.mkdir('daily').join('empty.jott')
+        path.write('')
+        Jottbook.invalidate_discover_cache()
+        jbook = Jottbook.discover(str(path))
+        assert jbook is not None
+        assert jbook.name == 'Notes'
@@ -6,6 +6,14 @@ from jott import fs
 
 class TestFSObject(object):
 
+    def test_fsobject_resolves_to_matching_type(self, jbpath):
+        assert isinstance(fs.fsobject(jbpath), fs.Directory)
+        assert isinstance(fs.fsobject(fs.join(jbpath, '.jott')), fs.File)
+
+    def test_fsobject_fails_for_missing_path(self, jbpath):
+        with pytest.raises(ValueError):
+            fs.fsobject(fs.join(jbpath, 'missing.md'))
+
     def test_fileobj_creation_with_dirpath_fails(self, jbpath):
         with pytest.raises(ValueError):
             fs.File(jbpath)
@@ -56,3 +64,68 @@ class TestFSObject(object):
     def test_fileobj_repr(self, jbpath):
         fileobj = fs.File(fs.join(jbpath, '.jott'))
         assert repr(fileobj) == "<File '.jott'>"
+
+    def test_fsobj_stat_is_cached_until_invalidated(self, jbpath):
+        fileobj = fs.File(fs.join(jbpath, '.jott'))
+        stat_result = fileobj.stat()
+        assert stat_result is fileobj.stat()
+        assert fileobj.last_modified == stat_result.st_mtime
+
+        fileobj.invalidate_stat()
+        assert fileobj.stat() is not stat_result
+
+    def test_dirobj_children_carry_stat_results(self, jbpath, monkeypatch):
+        children = list(fs.Directory(jbpath).children)
+        expected = [os.stat(c.fullpath).st_mtime for c in children]
+        calls = []
+        real_stat = os.stat
+        def counting_stat(*args, **kwargs):
+            calls.append(args[0])
+            return real_stat(*args, **kwargs)
+
+        monkeypatch.setattr(os, 'stat', counting_stat)
+        assert [c.stat().st_mtime for c in children] == expected
+        for c in children:
+            if isinstance(c, fs.File):
+                assert c.last_modified == c.stat().st_mtime
+        assert calls == []
+
+    def test_dirobj_directory_listing_skips_file_stats(self, tmpdir,
+                                                       monkeypatch):
+        tmpdir.mkdir('notes')
+        tmpdir.join('todo.txt').write('')
+        stated = []
+        real_scandir = os.scandir
+
+        class Entry(object):
+            def __init__(self, entry):
+                self._entry = entry
+                self.path = entry.path
+                self.is_dir = entry.is_dir
+
+            def stat(self):
+                stated.append(self._entry.name)
+                return self._entry.stat()
+
+        class Listing(object):
+            def __init__(self, path):
+                self._it = real_scandir(path)
+
+            def __enter__(self):
+                return (Entry(e) for e in self._it)
+
+            def __exit__(self, *exc_info):
+                self._it.close()
+
+        monkeypatch.setattr(os, 'scandir', Listing)
+        dirobj = fs.Directory(str(tmpdir), fs.DirListingFlag.DIRECTORY)
+        assert [c.basename for c in dirobj.children] == ['notes']
+        assert stated == ['notes']
+
+    def test_fileobj_remove_ignores_missing_file(self, tmpdir):
+        path = tmpdir.join('note.txt')
+        path.write('')
+        fileobj = fs.File(str(path))
+        fileobj.remove()
+        assert not path.exists()
+        fileobj.remove()